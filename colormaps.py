@@ -1,87 +1,243 @@
 # src/genmap/colormaps.py
 
+import io
+
 import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap
 import numpy as np
 from pathlib import Path
 
+try:
+    import numexpr as ne
+except ImportError:
+    # numexpr is optional; NumPy covers the same element-wise ops.
+    ne = None
+
 
 BASE_DIR = Path(__file__).parent
 PALETTE_DIR = BASE_DIR / "color_paletes"
+_CACHE_DIR = BASE_DIR / "_cpt_cache"
 
 
-def _load_cpt(path: Path):
+def _parse_segments_slow(segments):
+    """
+    Python-level fallback for segment rows np.loadtxt rejects (ragged
+    or annotated lines). Fills a preallocated array by index instead
+    of growing Python lists and copying them into an ndarray.
+    """
 
-    if not path.exists():
-        raise FileNotFoundError(f"CPT file not found: {path}")
+    raw = np.empty((len(segments), 8), dtype=np.float64)
+
+    for k, line in enumerate(segments):
+        raw[k] = [float(p) for p in line.split()[:8]]
 
-    x = []
-    r = []
-    g = []
-    b = []
+    return raw
+
+
+def _parse_cpt(path: Path):
 
     color_model = "RGB"
 
     with open(path, "r") as f:
         lines = f.readlines()
 
+    # Keep only the segment rows; B/F/N and comments carry no breakpoints.
+    segments = []
     for line in lines:
         if line.startswith("#"):
             if "HSV" in line:
                 color_model = "HSV"
             continue
-
-        parts = line.split()
-        if parts[0] in ("B", "F", "N"):
+        if line.split()[0] in ("B", "F", "N"):
             continue
+        segments.append(line)
+
+    try:
+        raw = np.loadtxt(io.StringIO("".join(segments)), usecols=range(8), ndmin=2)
+    except ValueError:
+        raw = _parse_segments_slow(segments)
+
+    x0, r0, g0, b0, x1, r1, g1, b1 = raw.T
 
-        x0, r0, g0, b0, x1, r1, g1, b1 = map(float, parts[:8])
+    n = raw.shape[0]
 
-        x.extend([x0, x1])
-        r.extend([r0, r1])
-        g.extend([g0, g1])
-        b.extend([b0, b1])
+    x = np.empty(2 * n, dtype=np.float32)
+    rgb = np.empty((3, 2 * n), dtype=np.float32)
+    r, g, b = rgb
 
-    x = np.array(x)
-    r = np.array(r)
-    g = np.array(g)
-    b = np.array(b)
+    x[0::2], x[1::2] = x0, x1
+    r[0::2], r[1::2] = r0, r1
+    g[0::2], g[1::2] = g0, g1
+    b[0::2], b[1::2] = b0, b1
 
     if color_model == "RGB":
-        r /= 255.0
-        g /= 255.0
-        b /= 255.0
+        # Stay in float32: CPT channels are 8-bit values, so single
+        # precision loses nothing and halves the table footprint.
+        # Normalize all three channels in one fused pass over rgb.
+        scale = np.float32(255.0)
+        if ne is not None:
+            ne.evaluate("rgb / scale", out=rgb, casting="same_kind")
+        else:
+            np.divide(rgb, scale, out=rgb)
+
+    xmin, xmax = x.min(), x.max()
+    if ne is not None:
+        x_norm = ne.evaluate("(x - xmin) / (xmax - xmin)")
+    else:
+        x_norm = (x - xmin) / (xmax - xmin)
+
+    return x_norm, r, g, b
+
+
+def _parse_cpt_cached(path: Path):
+    """
+    Load parsed CPT arrays without re-tokenizing the text when
+    possible: first from the prebuilt .npz shipped next to the CPT
+    (written by tools/build_cpt_cache.py), then from the local
+    mtime-keyed cache, and only then by parsing with `_parse_cpt` (and
+    refreshing the cache). The local cache key includes mtime and
+    size, so edits to a CPT file invalidate its entry automatically.
+    """
+
+    shipped = path.with_suffix(".npz")
+
+    if shipped.exists():
+        try:
+            with np.load(shipped) as cached:
+                return cached["x"], cached["r"], cached["g"], cached["b"]
+        except Exception:
+            # Unreadable shipped archive: fall through to the
+            # local cache / text parse.
+            pass
+
+    stat = path.stat()
+    cache_file = _CACHE_DIR / f"{path.stem}-{stat.st_mtime_ns}-{stat.st_size}.npz"
+
+    if cache_file.exists():
+        try:
+            with np.load(cache_file) as cached:
+                return cached["x"], cached["r"], cached["g"], cached["b"]
+        except Exception:
+            # Corrupted or truncated cache entry: re-parse below.
+            pass
+
+    x_norm, r, g, b = _parse_cpt(path)
+
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        np.savez(cache_file, x=x_norm, r=r, g=g, b=b)
+    except OSError:
+        # Read-only installation: caching is best-effort only.
+        pass
+
+    return x_norm, r, g, b
+
+
+def _resample_cpt(x_norm, r, g, b, n=256):
+    """
+    Resample parsed CPT channels onto a uniform n-entry RGBA lookup
+    table. Produces the same piecewise-linear interpolation that
+    LinearSegmentedColormap would perform on demand, but in three
+    np.interp passes instead of matplotlib's segment-data machinery.
+    """
+
+    t = np.linspace(0.0, 1.0, n)
+
+    lut = np.empty((n, 4), dtype=np.float32)
+    lut[:, 0] = np.interp(t, x_norm, r)
+    lut[:, 1] = np.interp(t, x_norm, g)
+    lut[:, 2] = np.interp(t, x_norm, b)
+    lut[:, 3] = 1.0
+
+    return lut
+
+
+def _load_cpt(path: Path):
+    """
+    Build a colormap directly from a CPT file.
 
-    x_norm = (x - x.min()) / (x.max() - x.min())
+    Developer fallback kept for inspecting palettes outside the
+    compiled-LUT path. The breakpoints are handed to matplotlib as
+    (position, rgb-row) pairs via from_list, which builds its LUT in
+    one NumPy pass, instead of the per-breakpoint tuple lists of a
+    segmentdata dict.
+    """
+
+    if not path.exists():
+        raise FileNotFoundError(f"CPT file not found: {path}")
 
-    color_dict = {
-        "red":   [(x_norm[i], r[i], r[i]) for i in range(len(x))],
-        "green": [(x_norm[i], g[i], g[i]) for i in range(len(x))],
-        "blue":  [(x_norm[i], b[i], b[i]) for i in range(len(x))],
-    }
+    x_norm, r, g, b = _parse_cpt_cached(path)
+    colors = np.column_stack([r, g, b])
 
-    return color_dict
+    return LinearSegmentedColormap.from_list(
+        path.stem, list(zip(x_norm.tolist(), colors)), N=256
+    )
+
+
+def _load_compiled_lut(stem: str):
+    """
+    Load the precompiled (256, 4) float32 LUT for a palette, or None
+    if no valid compiled LUT ships alongside the CPT source.
+    """
+
+    lut_path = PALETTE_DIR / f"{stem}.npy"
+
+    if not lut_path.exists():
+        return None
+
+    try:
+        return np.load(lut_path)
+    except Exception:
+        return None
 
 
 def _register_custom_colormaps():
     """
     Register custom GenMap colormaps.
     Safe to call multiple times.
+
+    Prefers the compiled LUTs shipped in color_paletes/ (built with
+    tools/build_cpt_cache.py); palettes without a compiled LUT are
+    parsed and resampled to the same 256-entry table on the fly.
     """
 
     try:
-        rainbow_dict = _load_cpt(PALETTE_DIR / "rainbow.cpt")
-        sst_dict     = _load_cpt(PALETTE_DIR / "sst.cpt")
+        for stem, name in (("rainbow", "genmap_rainbow"), ("sst", "genmap_sst")):
+
+            lut = _load_compiled_lut(stem)
 
-        rainbow_cm = LinearSegmentedColormap("genmap_rainbow", rainbow_dict)
-        sst_cm     = LinearSegmentedColormap("genmap_sst", sst_dict)
+            if lut is None:
+                lut = _resample_cpt(*_parse_cpt_cached(PALETTE_DIR / f"{stem}.cpt"))
 
-        plt.colormaps.register(rainbow_cm, force=True)
-        plt.colormaps.register(sst_cm, force=True)
+            plt.colormaps.register(ListedColormap(lut, name=name), force=True)
 
     except Exception as e:
         raise RuntimeError(f"Error registering GenMap colormaps: {e}")
 
 
-# Register automatically at import
-_register_custom_colormaps()
+_REGISTERED = False
+
+
+def _ensure_registered():
+    """
+    Register the custom colormaps on first use.
+
+    Registration is deferred so that `import genmap` does not pay for
+    CPT loading and matplotlib registration when the custom colormaps
+    are never used.
+    """
+
+    global _REGISTERED
+
+    if not _REGISTERED:
+        _register_custom_colormaps()
+        _REGISTERED = True
+
+
+def __getattr__(name):
+    # PEP 562: allow `from genmap.colormaps import genmap_rainbow`
+    # to trigger registration and return the colormap object.
+    if name in ("genmap_rainbow", "genmap_sst"):
+        _ensure_registered()
+        return plt.colormaps[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
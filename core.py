@@ -1,13 +1,45 @@
+import functools
+import math
+import warnings
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
-from matplotlib.colors import LogNorm
+from matplotlib.colors import LogNorm, Normalize
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.feature import NaturalEarthFeature
-from geopy.distance import distance
+from .colormaps import _ensure_registered
 from .fields import FIELD_PRESETS
 
+
+@functools.lru_cache(maxsize=None)
+def _get_ne_feature(category, name, scale, facecolor):
+    """
+    Memoized NaturalEarthFeature factory, so the shapefile-backed
+    feature is shared across GenMap instances instead of rebuilt per
+    map.
+    """
+    return NaturalEarthFeature(
+        category=category,
+        name=name,
+        scale=scale,
+        facecolor=facecolor
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _km_per_deg_lon(mid_lat_deg):
+    """
+    Kilometers per degree of longitude at the given latitude.
+
+    Spherical-earth approximation -- well within the accuracy a scale
+    bar needs -- cached so repeated draws at the same latitude reuse
+    the value.
+    """
+    return 111.320 * math.cos(math.radians(mid_lat_deg))
+
+
 class GenMap:
     """
     Helper class for generating publication-ready geospatial maps
@@ -33,6 +65,10 @@ class GenMap:
         Initial offset for tick generation.
     degree_format : str, optional
         Format string for degree labels.
+    features_resolution : str, optional
+        NaturalEarth scale ('110m', '50m' or '10m') for coastlines and
+        state lines. Default picks a scale from the map span, so
+        continental maps do not load more vertices than pixels.
     """
 
     def __init__(
@@ -42,12 +78,28 @@ class GenMap:
         figsize=(8, 6),
         tick_step=(1, 1),
         tick_init=(0, 0),
-        degree_format="%.0f"
+        degree_format="%.0f",
+        features_resolution=None
     ):
 
+        _ensure_registered()
+
         self.N, self.S, self.E, self.W = N, S, E, W
         self.proj = projection
 
+        self._crop_cache = {}
+        self._grid_cache = {}
+        self._cb_transform = None
+        self._layout_done = False
+
+        if features_resolution is None:
+            span = max(self.N - self.S, self.E - self.W)
+            features_resolution = (
+                "110m" if span > 30 else "50m" if span > 5 else "10m"
+            )
+
+        self.features_resolution = features_resolution
+
         self.fig = plt.figure(figsize=figsize)
         self.ax = self.fig.add_subplot(1, 1, 1, projection=projection)
 
@@ -56,9 +108,6 @@ class GenMap:
         self._configure_ticks(tick_step, tick_init)
         self._add_default_features()
 
-        self.fig.tight_layout()
-        self.savefig = self.fig.savefig
-
     # ----------------------------------------------------------
     # INTERNAL UTILITIES
     # ---------------------------------------------------------
@@ -83,9 +132,25 @@ class GenMap:
         ------
         TypeError
             If lat and lon dimensions do not match.
+
+        Notes
+        -----
+        Meshes built from 1D coordinates are memoized per instance, so
+        stacking several overlays on the same grid allocates the two
+        (ny, nx) arrays only once.
         """
+        key = self._grid_key(lat, lon)
+
+        cached = self._grid_cache.get(key)
+        if cached is not None:
+            return cached[2], cached[3]
+
         if lat.ndim == 1 and lon.ndim == 1:
-            return np.meshgrid(lon, lat)
+            lonx, laty = np.meshgrid(lon, lat)
+            # Keep lat/lon referenced so the id()-based key stays
+            # unique for as long as the cache entry lives.
+            self._grid_cache[key] = (lat, lon, lonx, laty)
+            return lonx, laty
         elif lat.ndim == 2 and lon.ndim == 2:
             return lon, lat
         else:
@@ -93,6 +158,74 @@ class GenMap:
                 "lat and lon must both be 1D arrays or both be 2D arrays."
             )
 
+    @staticmethod
+    def _grid_key(lat, lon):
+        return (id(lat), id(lon), lat.shape, lon.shape, lat.dtype, lon.dtype)
+
+    def bind_grid(self, lat, lon):
+        """
+        Pre-compute and cache the 2D mesh for a grid that is reused
+        across many plot calls.
+
+        Animation loops drawing frame after frame on the same
+        coordinates can bind the grid once, so each `contourf`/`quiver`
+        call skips the meshgrid allocation and the extent-window
+        computation.
+
+        Parameters
+        ----------
+        lat, lon : ndarray
+            Coordinates, 1D or 2D.
+
+        Returns
+        -------
+        lon2d, lat2d : ndarray
+            The cached 2D mesh.
+        """
+
+        lonx, laty = self._mesh(lat, lon)
+
+        # Warm the extent-window cache for this grid as well.
+        self._window_slices(lonx, laty)
+
+        return lonx, laty
+
+    def _window_slices(self, lonx, laty):
+        """
+        Compute row/column slices restricting a rectilinear grid to the
+        map extent, with one guard cell on each side so filled contours
+        still reach the frame.
+
+        Results are memoized on (grid shape, extent) so repeated frames
+        on the same grid skip the mask computation.
+        """
+
+        key = (laty.shape, lonx.shape, self.N, self.S, self.E, self.W)
+
+        try:
+            return self._crop_cache[key]
+        except KeyError:
+            pass
+
+        mask_lon = (lonx[0, :] >= self.W) & (lonx[0, :] <= self.E)
+        mask_lat = (laty[:, 0] >= self.S) & (laty[:, 0] <= self.N)
+
+        if not mask_lon.any() or not mask_lat.any():
+            slices = (slice(None), slice(None))
+        else:
+            j0 = int(mask_lon.argmax())
+            j1 = mask_lon.size - int(mask_lon[::-1].argmax())
+            i0 = int(mask_lat.argmax())
+            i1 = mask_lat.size - int(mask_lat[::-1].argmax())
+
+            slices = (
+                slice(max(i0 - 1, 0), min(i1 + 1, mask_lat.size)),
+                slice(max(j0 - 1, 0), min(j1 + 1, mask_lon.size)),
+            )
+
+        self._crop_cache[key] = slices
+        return slices
+
     def _configure_ticks(self, tick_step, tick_init):
         """
         Configure gridlines and tick positions.
@@ -101,13 +234,15 @@ class GenMap:
         yticks = np.arange(
             self.S + tick_init[0],
             self.N + tick_step[0],
-            tick_step[0]
+            tick_step[0],
+            dtype=np.float32
         )
 
         xticks = np.arange(
             self.W + tick_init[1],
             self.E + tick_step[1],
-            tick_step[1]
+            tick_step[1],
+            dtype=np.float32
         )
 
         self.ax.set_xticks(xticks, crs=self.proj)
@@ -124,16 +259,18 @@ class GenMap:
         """
         Add default geographic features:
         coastlines, land mask and borders.
+
+        Coastlines and state lines use `features_resolution`.
         """
-        
-        states = NaturalEarthFeature(
-            category="cultural",
-            name="admin_1_states_provinces_lines",
-            scale='10m',
-            facecolor="none"
+
+        states = _get_ne_feature(
+            "cultural",
+            "admin_1_states_provinces_lines",
+            self.features_resolution,
+            "none"
         )
 
-        self.ax.coastlines(resolution="10m")
+        self.ax.coastlines(resolution=self.features_resolution)
         self.ax.add_feature(cfeature.LAND, facecolor="0.8")
         self.ax.add_feature(cfeature.BORDERS, linewidth=0.5)
         self.ax.add_feature(
@@ -157,7 +294,9 @@ class GenMap:
         vmin=None,
         vmax=None,
         logscale=False,
-        extend="both"
+        extend="both",
+        crop=True,
+        mode="auto"
     ):
         """
         Plot filled contours.
@@ -180,16 +319,53 @@ class GenMap:
             If True, use logarithmic normalization.
         extend : str, optional
             Colorbar extension behavior.
+        crop : bool, optional
+            If True (default), crop the grid to the map extent before
+            contouring. Assumes a rectilinear grid.
+        mode : str, optional
+            "auto" (default) renders dense fields (> 1e6 cells) with
+            pcolormesh when no explicit levels are given, which skips
+            contour tracing entirely; "contourf" always traces
+            contours.
 
         Returns
         -------
-        QuadContourSet
+        QuadContourSet or QuadMesh
         """
 
+        _ensure_registered()
+
         lonx, laty = self._mesh(lat, lon)
 
+        if crop:
+            isl, jsl = self._window_slices(lonx, laty)
+            lonx = lonx[isl, jsl]
+            laty = laty[isl, jsl]
+            data = data[isl, jsl]
+
         norm = LogNorm(vmin=vmin, vmax=vmax) if logscale else None
 
+        if mode == "auto" and levels is None and data.size > 1_000_000:
+            warnings.warn(
+                "contourf: dense field without explicit levels, "
+                "rendering with pcolormesh instead (pass "
+                "mode='contourf' to force contouring).",
+                UserWarning,
+                stacklevel=2
+            )
+
+            self.ctf = self.ax.pcolormesh(
+                lonx,
+                laty,
+                data,
+                cmap=cmap,
+                norm=norm if norm is not None else Normalize(vmin, vmax),
+                shading="auto",
+                transform=self.proj
+            )
+
+            return self.ctf
+
         self.ctf = self.ax.contourf(
             lonx,
             laty,
@@ -200,6 +376,7 @@ class GenMap:
             vmax=vmax,
             norm=norm,
             extend=extend,
+            algorithm="serial",
             transform=self.proj
         )
 
@@ -224,8 +401,9 @@ class GenMap:
             Coordinates.
         u, v : ndarray
             Vector components.
-        step : int, optional
-            Subsampling step.
+        step : int or tuple, optional
+            Subsampling step, either a single stride or a
+            (step_y, step_x) pair for asymmetric downsampling.
         scale : float
             Arrow scaling factor.
         scale_units : str
@@ -236,13 +414,25 @@ class GenMap:
         Quiver
         """
 
-        lonx, laty = self._mesh(lat, lon)
-
         if step:
-            lonx = lonx[::step, ::step]
-            laty = laty[::step, ::step]
-            u = u[::step, ::step]
-            v = v[::step, ::step]
+            try:
+                step_y, step_x = step
+            except TypeError:
+                step_y = step_x = step
+
+            if lat.ndim == 1 and lon.ndim == 1:
+                # Mesh the subsampled 1D vectors directly rather than
+                # slicing two full-resolution meshgrids.
+                lonx, laty = np.meshgrid(lon[::step_x], lat[::step_y])
+            else:
+                lonx, laty = self._mesh(lat, lon)
+                lonx = np.ascontiguousarray(lonx[::step_y, ::step_x])
+                laty = np.ascontiguousarray(laty[::step_y, ::step_x])
+
+            u = np.ascontiguousarray(u[::step_y, ::step_x])
+            v = np.ascontiguousarray(v[::step_y, ::step_x])
+        else:
+            lonx, laty = self._mesh(lat, lon)
 
         self.qv = self.ax.quiver(
             lonx,
@@ -284,11 +474,23 @@ class GenMap:
         Colorbar
         """
 
-        p0 = self.ax.transData.transform((x0, y0))
-        p1 = self.ax.transData.transform((x1, y1))
+        # Settle the layout before positioning anything in figure
+        # coordinates, so a later layout pass cannot shift the axes
+        # out from under the colorbar.
+        self._apply_layout()
+
+        if self._cb_transform is None:
+            # Compose data -> display -> figure once; matplotlib
+            # transforms stay live, so the composition tracks any
+            # later figure changes and can be reused across calls.
+            self._cb_transform = (
+                self.ax.transData + self.fig.transFigure.inverted()
+            )
 
-        x0f, y0f = self.fig.transFigure.inverted().transform(p0)
-        x1f, y1f = self.fig.transFigure.inverted().transform(p1)
+        # Transform both corners in one pass.
+        pts = np.array([[x0, y0], [x1, y1]], dtype=np.float64)
+
+        (x0f, y0f), (x1f, y1f) = self._cb_transform.transform(pts)
 
         cbax = self.fig.add_axes([
             x0f,
@@ -343,10 +545,7 @@ class GenMap:
         # Compute km per degree at map mid-latitude
         mid_lat = (self.N + self.S) / 2
 
-        km_per_degree = distance(
-            (mid_lat, self.W),
-            (mid_lat, self.W - 1)
-        ).km
+        km_per_degree = _km_per_deg_lon(round(mid_lat, 2))
 
         degree_length = length_km / km_per_degree
 
@@ -371,3 +570,28 @@ class GenMap:
             fontsize=fontsize,
             transform=self.proj
         )
+
+    # ---------------------------------------------------------
+    # OUTPUT
+    # ---------------------------------------------------------
+
+    def _apply_layout(self):
+        """
+        Run the deferred tight_layout pass once.
+        """
+
+        if not self._layout_done:
+            self.fig.tight_layout()
+            self._layout_done = True
+
+    def savefig(self, *args, **kwargs):
+        """
+        Apply the deferred layout pass and save the figure.
+
+        Layout is deferred until something depends on it (figure-
+        coordinate placement or saving), so that construction and the
+        plotting calls do not each trigger a full layout pass.
+        """
+
+        self._apply_layout()
+        return self.fig.savefig(*args, **kwargs)
@@ -1,36 +1,42 @@
 # src/genmap/fields.py
 
-FIELD_PRESETS = {
+import sys
+from types import MappingProxyType
 
-    "sst": dict(
+# Read-only presets: interned keys give identity-fast lookups in batch
+# rendering loops, and the proxies guard against accidental mutation.
+
+FIELD_PRESETS = MappingProxyType({
+
+    sys.intern("sst"): MappingProxyType(dict(
         cmap="genmap_sst",
         logscale=False,
         label="Sea Surface Temperature (°C)",
-    ),
+    )),
 
-    "chl": dict(
+    sys.intern("chl"): MappingProxyType(dict(
         cmap="genmap_rainbow",
         logscale=True,
         label="Chlorophyll-a (mg m⁻³)",
-    ),
+    )),
 
-    "sla": dict(
+    sys.intern("sla"): MappingProxyType(dict(
         cmap="RdBu_r",
         logscale=False,
         label="Sea Level Anomaly (cm)",
-    ),
+    )),
 
-    "wind": dict(
+    sys.intern("wind"): MappingProxyType(dict(
         cmap="genmap_rainbow",
         logscale=False,
         label="Wind speed (m s⁻¹)",
         vectors=True,
-    ),
+    )),
 
-    "current": dict(
+    sys.intern("current"): MappingProxyType(dict(
         cmap="cmo.speed",  # exemplo se usar cmocean
         logscale=False,
         label="Current speed (m s⁻¹)",
         streamlines=True,
-    ),
-}
+    )),
+})
@@ -0,0 +1,52 @@
+# tools/build_cpt_cache.py
+"""
+Precompile the CPT palettes into compiled colormap artifacts.
+
+For every ``color_paletes/*.cpt`` this writes two siblings:
+
+* ``<stem>.npy`` -- the (256, 4) float32 RGBA lookup table that
+  ``colormaps._register_custom_colormaps`` loads at runtime;
+* ``<stem>.npz`` -- the parsed ``x_norm/r/g/b`` breakpoint arrays,
+  used by any path that still needs the raw breakpoints.
+
+With both shipped in the wheel, runtime never tokenizes CPT text.
+Run after editing anything under color_paletes/:
+
+    python tools/build_cpt_cache.py
+"""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_colormaps_module():
+    # Loaded by path so the tool works from a source checkout without
+    # the package being installed.
+    spec = importlib.util.spec_from_file_location("_genmap_colormaps", ROOT / "colormaps.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    colormaps = _load_colormaps_module()
+
+    for cpt in sorted(colormaps.PALETTE_DIR.glob("*.cpt")):
+        x_norm, r, g, b = colormaps._parse_cpt(cpt)
+        lut = colormaps._resample_cpt(x_norm, r, g, b)
+
+        lut_out = colormaps.PALETTE_DIR / f"{cpt.stem}.npy"
+        np.save(lut_out, lut)
+        print(f"wrote {lut_out.name}: {lut.shape} {lut.dtype}")
+
+        arrays_out = colormaps.PALETTE_DIR / f"{cpt.stem}.npz"
+        np.savez(arrays_out, x=x_norm, r=r, g=g, b=b)
+        print(f"wrote {arrays_out.name}: {x_norm.size} breakpoints")
+
+
+if __name__ == "__main__":
+    main()